@@ -11,26 +11,17 @@ class SparseQTable:
             raise(Exception("Length of state expected to be {}".format(self.dimension)))
         key = state+(action,)
         self.elements[key] = value
-        try:
-            if self._max_action_value[state] < value:
-                self._max_action_value[state] = value
-        except KeyError:
+        max_value = self._max_action_value.get(state)
+        if max_value is None or max_value < value:
             self._max_action_value[state] = value
-        try:
-            if self._best_action[state]["value"] < value:
-                self._best_action[state] = {"action": action, "value": value}
-        except KeyError:
-            self._best_action[state] = {"action": action, "value": value} 
+        best_action = self._best_action.get(state)
+        if best_action is None or best_action["value"] < value:
+            self._best_action[state] = {"action": action, "value": value}
 
     def read_value(self, state, action):
         if len(state) != self.dimension:
             raise(Exception("Length of state expected to be {}".format(self.dimension)))
-        try:
-            key = state + (action, )
-            value = self.elements[key]
-        except KeyError:
-            value = self.default_value
-        return value
+        return self.elements.get(state + (action, ), self.default_value)
 
     def total(self):
         tensor_sum = 0
@@ -41,23 +32,13 @@ class SparseQTable:
     def max_action_value(self, state):
         if len(state) != self.dimension:
             raise(Exception("Num elements in state expected to be {}".format(self.dimension)))
-        max_value = self.default_value
-        try:
-            max_value = max(self._max_action_value[state],max_value)
-        except KeyError:
-            pass
-        return max_value
+        return max(self._max_action_value.get(state, self.default_value), self.default_value)
 
     def best_action(self, state):
         if len(state) != self.dimension:
             raise(Exception("Num elements in state expected to be {}".format(self.dimension)))
-        max_value = None
-        best_action = 0
-        try:
-            best_action=self._best_action[state]["action"]
-        except KeyError:
-            pass
-        return best_action
+        best_action = self._best_action.get(state)
+        return best_action["action"] if best_action is not None else 0
 
     def count(self):
         return len(self.elements)
@@ -72,9 +53,9 @@ class SparseQTableEncoder(json.JSONEncoder):
                 "value":{
                     "dimension": obj.dimension,
                     "default_value": obj.default_value,
-                    "elements": {json.dumps(k): v for k, v in obj.elements.items()},
-                    "max_action_value": {json.dumps(k): v for k, v in obj._max_action_value.items()},
-                    "best_action": {json.dumps(k): v for k, v in obj._best_action.items()}
+                    "elements": {json.dumps(k, separators=(",", ":")): v for k, v in obj.elements.items()},
+                    "max_action_value": {json.dumps(k, separators=(",", ":")): v for k, v in obj._max_action_value.items()},
+                    "best_action": {json.dumps(k, separators=(",", ":")): v for k, v in obj._best_action.items()}
                 }
             }
         return super(SparseQTableEncoder, self).default(obj)
@@ -20,6 +20,8 @@ class BeergameQlOB(Model):
     distributor_q_table = SparseQTable(dimension=1)
     wholesaler_q_table = SparseQTable(dimension=1)
     retailer_q_table = SparseQTable(dimension=1)
+
+    supply_chain_agents = frozenset({"brewery", "distributor", "wholesaler", "retailer"})
     
     @staticmethod
     def dump_q_tables(path,format="PICKLE"):
@@ -35,12 +37,12 @@ class BeergameQlOB(Model):
             # the JSON dump format isn't a framed protocoll, so we cannot dump multiple objects into one file
             # hence we create our own frame using a dict
             qtable_json = {}
-            qtable_json["brewery"] = json.dumps(BeergameQlOB.brewery_q_table,cls=SparseQTableEncoder)
-            qtable_json["distributor"] = json.dumps(BeergameQlOB.distributor_q_table,cls=SparseQTableEncoder)
-            qtable_json["wholesaler"] = json.dumps(BeergameQlOB.wholesaler_q_table,cls=SparseQTableEncoder)
-            qtable_json["retailer"] = json.dumps(BeergameQlOB.retailer_q_table,cls=SparseQTableEncoder)
+            qtable_json["brewery"] = json.dumps(BeergameQlOB.brewery_q_table,cls=SparseQTableEncoder,separators=(",", ":"))
+            qtable_json["distributor"] = json.dumps(BeergameQlOB.distributor_q_table,cls=SparseQTableEncoder,separators=(",", ":"))
+            qtable_json["wholesaler"] = json.dumps(BeergameQlOB.wholesaler_q_table,cls=SparseQTableEncoder,separators=(",", ":"))
+            qtable_json["retailer"] = json.dumps(BeergameQlOB.retailer_q_table,cls=SparseQTableEncoder,separators=(",", ":"))
             file = open(path,"w")
-            json.dump(qtable_json,file)
+            json.dump(qtable_json,file,separators=(",", ":"))
             file.close()
         
     
@@ -138,7 +140,6 @@ class BeergameQlOB(Model):
         self.game_over_round=24
         
     def end_round(self, time, sim_round, step):
-        supply_chain_agents = {"brewery", "distributor", "wholesaler", "retailer"}
         controlling_agent = None
         total_reward = 0
         
@@ -148,7 +149,7 @@ class BeergameQlOB(Model):
 
         for agent in self.agents:
             reward = 0
-            if agent.agent_type in supply_chain_agents and not self.game_over:
+            if agent.agent_type in self.supply_chain_agents and not self.game_over:
                 if (agent.order_balance < 0  or agent.order_balance > 1400):
                     self.game_over = True
                     self.game_over_round = time + 1 # run one more round to pickup the rewards, then stop
@@ -34,12 +34,15 @@ class OrderBalanceStrategy(OrderStrategy):
         if self.agent.model.game_over and time > self.agent.model.game_over_round:
             return 0
         
+        # the current state is the order balance minus the incoming order, compute it once
+        current_state = self.agent.order_balance-self.agent.incoming_order
+
         # update the q_table with the reward from last round
         last_action_value = self.q_table.read_value(
                 self.last_state,
                 self.last_action
         )
-        max_next_action_value = self.q_table.max_action_value((self.agent.order_balance-self.agent.incoming_order,))
+        max_next_action_value = self.q_table.max_action_value((current_state,))
         new_action_value = (
             last_action_value +
             self.agent.model.alpha*(
@@ -53,9 +56,9 @@ class OrderBalanceStrategy(OrderStrategy):
         if random.uniform(0, 1) < self.agent.model.epsilon:
             amount =  random.randint(0, round(1.5*self.agent.incoming_order)) 
         else:
-            amount = self.q_learning_order(time)
+            amount = self.q_table.best_action((current_state,))
             
         # update q-learning data
-        self.last_state = (self.agent.order_balance-self.agent.incoming_order,)
+        self.last_state = (current_state,)
         self.last_action = amount
         return amount
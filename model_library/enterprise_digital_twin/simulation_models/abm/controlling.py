@@ -96,21 +96,24 @@ class Controlling(Agent):
         self.projects += event.data["count"]
 
     def act(self, time, round_no, step_no):
+
+        # the sd model runs at the granularity of the abm dt, convert the time once per step
+        sd_time = self.model.sd_time(time)
         
-        self.model._exchange["salaries"][self.model.sd_time(time)] = self._salaries
+        self.model._exchange["salaries"][sd_time] = self._salaries
         self._salaries = 0.0
 
-        self.model._exchange["workplace_cost"][self.model.sd_time(time)] = self._workplace_cost
+        self.model._exchange["workplace_cost"][sd_time] = self._workplace_cost
         self._workplace_cost = 0.0
         
-        self.model._exchange["fixed_cost"][self.model.sd_time(time)] = self.model.fixed_cost*self.model.dt
+        self.model._exchange["fixed_cost"][sd_time] = self.model.fixed_cost*self.model.dt
 
-        self.model._exchange["revenue"][self.model.sd_time(time)] = self._revenue
-        self.model._exchange["revenue_risk"][self.model.sd_time(time)] = (self._revenue_risk / self._revenue) if self._revenue > 0.0  else 0.0
+        self.model._exchange["revenue"][sd_time] = self._revenue
+        self.model._exchange["revenue_risk"][sd_time] = (self._revenue_risk / self._revenue) if self._revenue > 0.0  else 0.0
         self._revenue = 0.0
         self._revenue_risk = 0.0
 
-        self.model._exchange["consulting_effort"][self.model.sd_time(time)] = self._consulting_effort
+        self.model._exchange["consulting_effort"][sd_time] = self._consulting_effort
         self._consulting_effort = 0.0
         
         self.consultant_demand = self._consultant_demand
@@ -118,30 +121,30 @@ class Controlling(Agent):
 
         self.consultant_capacity = self._consultant_capacity
         self.consultant_capacity_fte = self._consultant_capacity/self.model.dt
-        self.model._exchange["consultant_capacity"][self.model.sd_time(time)] = self._consultant_capacity
+        self.model._exchange["consultant_capacity"][sd_time] = self._consultant_capacity
         self._consultant_capacity = 0.0
 
 
-        self.revenue = self.model.sd_model.evaluate_equation("revenue.revenue",self.model.sd_time(time))
-        self.accumulated_revenue = self.model.sd_model.evaluate_equation("revenue.accumulated_revenue",self.model.sd_time(time))
-        self.revenue_risk = self.model.sd_model.evaluate_equation("revenue.revenue_risk",self.model.sd_time(time))
+        self.revenue = self.model.sd_model.evaluate_equation("revenue.revenue",sd_time)
+        self.accumulated_revenue = self.model.sd_model.evaluate_equation("revenue.accumulated_revenue",sd_time)
+        self.revenue_risk = self.model.sd_model.evaluate_equation("revenue.revenue_risk",sd_time)
 
-        self.expenses = self.model.sd_model.evaluate_equation("cost.expenses",self.model.sd_time(time))
-        self.accumulated_expenses = self.model.sd_model.evaluate_equation("cost.accumulated_expenses",self.model.sd_time(time))
+        self.expenses = self.model.sd_model.evaluate_equation("cost.expenses",sd_time)
+        self.accumulated_expenses = self.model.sd_model.evaluate_equation("cost.accumulated_expenses",sd_time)
         
-        self.earnings = self.model.sd_model.evaluate_equation("earnings.earnings",self.model.sd_time(time))
-        self.accumulated_earnings = self.model.sd_model.evaluate_equation("earnings.accumulated_earnings",self.model.sd_time(time))
+        self.earnings = self.model.sd_model.evaluate_equation("earnings.earnings",sd_time)
+        self.accumulated_earnings = self.model.sd_model.evaluate_equation("earnings.accumulated_earnings",sd_time)
 
 
-        self.cash = self.model.sd_model.evaluate_equation("cash.cash",self.model.sd_time(time))
-        self.cash_flow = self.model.sd_model.evaluate_equation("cash.cash_flow",self.model.sd_time(time))
+        self.cash = self.model.sd_model.evaluate_equation("cash.cash",sd_time)
+        self.cash_flow = self.model.sd_model.evaluate_equation("cash.cash_flow",sd_time)
 
-        self.avg_consulting_fee = self.model.sd_model.evaluate_equation("controlling.avg_consulting_fee",self.model.sd_time(time))
-        self.overall_avg_consulting_fee = self.model.sd_model.evaluate_equation("controlling.overall_avg_consulting_fee",self.model.sd_time(time))
+        self.avg_consulting_fee = self.model.sd_model.evaluate_equation("controlling.avg_consulting_fee",sd_time)
+        self.overall_avg_consulting_fee = self.model.sd_model.evaluate_equation("controlling.overall_avg_consulting_fee",sd_time)
 
-        self.avg_utilization = self.model.sd_model.evaluate_equation("controlling.avg_utilization",self.model.sd_time(time))
-        self.overall_avg_utilization = self.model.sd_model.evaluate_equation("controlling.overall_avg_utilization",self.model.sd_time(time))
+        self.avg_utilization = self.model.sd_model.evaluate_equation("controlling.avg_utilization",sd_time)
+        self.overall_avg_utilization = self.model.sd_model.evaluate_equation("controlling.overall_avg_utilization",sd_time)
 
-        self.profit_margin = self.model.sd_model.evaluate_equation("controlling.profit_margin",self.model.sd_time(time))
-        self.overall_profit_margin = self.model.sd_model.evaluate_equation("controlling.overall_profit_margin",self.model.sd_time(time))
+        self.profit_margin = self.model.sd_model.evaluate_equation("controlling.profit_margin",sd_time)
+        self.overall_profit_margin = self.model.sd_model.evaluate_equation("controlling.overall_profit_margin",sd_time)
 